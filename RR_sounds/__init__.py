@@ -0,0 +1,3 @@
+from .rr_sound_separator import RRSoundDetector, RRSyllable
+
+__all__ = ['RRSoundDetector', 'RRSyllable']
@@ -7,14 +7,22 @@ Finds and highlights syllables containing R sounds in Portuguese text for educat
 import re
 import sys
 import os
+from collections import Counter
+from functools import lru_cache
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 
 # Add the parent directory to import the syllabifier
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from portuguese_syllabifier_nltk import PortugueseSyllabifierNLTK
+from portuguese_syllabifier_nltk import get_shared_syllabifier
 
-@dataclass
+# Word tokenizer, compiled once at import time
+_WORD_RE = re.compile(r'\b[a-zA-ZáâãàéêèíîìóôõòúûùçÇ]+\b')
+
+# Byte value scanned for when locating R sounds
+_R_BYTE = ord('r')
+
+@dataclass(frozen=True, slots=True)
 class RRSyllable:
     """Represents a syllable containing an R sound."""
     word: str
@@ -32,9 +40,14 @@ class RRSoundDetector:
     """
     
     def __init__(self):
-        # Initialize the syllabifier
-        self.syllabifier = PortugueseSyllabifierNLTK()
-        
+        # Reuse the process-wide syllabifier instead of building a new one
+        self.syllabifier = get_shared_syllabifier()
+
+        # Memoize syllabification keyed on the lowercased word: natural text
+        # repeats a small vocabulary, so repeated tokens become a dict hit
+        # instead of a full rule-engine pass
+        self._syl_cache = lru_cache(maxsize=8192)(self._syllabify_lower)
+
         # Define R sound patterns with difficulty levels
         self.r_patterns = {
             # Double R (most difficult)
@@ -50,7 +63,43 @@ class RRSoundDetector:
                 'examples': ['rato', 'rosa', 'rua', 'rio', 'rei', 'porta', 'carta']
             }
         }
+
+        # Frozen trailing-argument templates for RRSyllable construction,
+        # resolved once instead of via dict lookups per emitted syllable
+        self._rr_tpl = (self.r_patterns['rr']['difficulty'],
+                        self.r_patterns['rr']['pronunciation'],
+                        self.r_patterns['rr']['examples'][0],
+                        'double_rr')
+        self._r_tpl = (self.r_patterns['r']['difficulty'],
+                       self.r_patterns['r']['pronunciation'],
+                       self.r_patterns['r']['examples'][0],
+                       'single_r')
     
+    def _syllabify_lower(self, word_lower: str) -> Tuple[Tuple[str, ...], bool, Tuple[Tuple[int, int], ...]]:
+        """
+        Syllabify a lowercased word and precompute its R metadata for the cache.
+
+        Returns a tuple of (syllable tuple, 'word contains rr' flag, relative
+        spans of the R-carrying syllables). R sounds are located with
+        bytes.find over a latin-1 buffer — one byte per character, so offsets
+        line up with string positions and accented letters can never match
+        'r'. The relative spans are already verified against the word, so
+        each occurrence only needs to shift them by its own start offset.
+        """
+        syllables = tuple(self.syllabifier.syllabify(word_lower))
+        buf = word_lower.encode('latin-1', 'replace')
+
+        rel_spans = []
+        pos = 0
+        for syllable in syllables:
+            end = pos + len(syllable)
+            # Keep only syllables that carry an R and line up with the word
+            if buf.find(_R_BYTE, pos, end) >= 0 and word_lower[pos:end] == syllable:
+                rel_spans.append((pos, end))
+            pos = end
+
+        return syllables, 'rr' in word_lower, tuple(rel_spans)
+
     def tokenize_text(self, text: str) -> List[str]:
         """
         Tokenize text into words using simple string splitting.
@@ -61,10 +110,8 @@ class RRSoundDetector:
         Returns:
             List of words
         """
-        # Simple word tokenization using regex
-        import re
-        words = re.findall(r'\b[a-zA-ZáâãàéêèíîìóôõòúûùçÇ]+\b', text)
-        return words
+        # Simple word tokenization using the precompiled regex
+        return _WORD_RE.findall(text)
     
     def detect_rr_syllables(self, text: str) -> List[RRSyllable]:
         """
@@ -77,99 +124,73 @@ class RRSoundDetector:
             List of RRSyllable objects with detected syllables
         """
         syllables_with_r = []
-        words = self.tokenize_text(text)
-        
-        # Track word positions to avoid duplicates
         text_lower = text.lower()
-        current_pos = 0
-        
-        # Process each word individually
-        for word in words:
+
+        # Single regex pass: finditer yields each token together with its
+        # authoritative start offset, replacing the old tokenize-then-find
+        # position discovery. Distinct words are still syllabified only once.
+        for match in _WORD_RE.finditer(text):
+            word = match.group()
             word_lower = word.lower()
-            
-            # Find the word position starting from current_pos
-            word_start = text_lower.find(word_lower, current_pos)
-            
-            if word_start != -1:
-                word_syllables = self._analyze_word_syllables(word, text, word_start)
-                syllables_with_r.extend(word_syllables)
-                current_pos = word_start + len(word)
-            else:
-                # Fallback: try to find the word anywhere in the text
-                word_syllables = self._analyze_word_syllables(word, text)
-                syllables_with_r.extend(word_syllables)
-        
+
+            # Fast-reject words with no R sound
+            if 'r' not in word_lower:
+                continue
+
+            word_syllables = self._analyze_word_syllables(word, text, text_lower,
+                                                          match.start(),
+                                                          self._syl_cache(word_lower))
+            syllables_with_r.extend(word_syllables)
+
         # Sort by position in text
         syllables_with_r.sort(key=lambda x: x.syllable_start)
         return syllables_with_r
     
-    def _analyze_word_syllables(self, word: str, original_text: str, word_start: int = None) -> List[RRSyllable]:
+    def _analyze_word_syllables(self, word: str, original_text: str, text_lower: str = None,
+                                word_start: int = None, word_info: Tuple = None) -> List[RRSyllable]:
         """
         Analyze a single word's syllables for R sounds.
-        
+
         Args:
             word: Word to analyze
             original_text: Original text for position calculation
+            text_lower: Pre-lowered copy of the original text (optional)
             word_start: Starting position of the word in the text (optional)
-            
+            word_info: Precomputed cache record for the word (optional)
+
         Returns:
             List of RRSyllable objects found in the word
         """
         syllables_with_r = []
-        
-        # Get syllables for the word
-        syllables = self.syllabifier.syllabify(word)
-        
-        # Find the word position in the original text (case-insensitive)
+
+        # Get syllables for the word (cached on the normalized lowercase form)
         word_lower = word.lower()
-        if word_start is None:
+        if word_info is None:
+            word_info = self._syl_cache(word_lower)
+        rel_spans = word_info[2]
+
+        # Find the word position in the original text (case-insensitive)
+        if text_lower is None:
             text_lower = original_text.lower()
+        if word_start is None:
             word_start = text_lower.find(word_lower)
-        
+
         if word_start == -1:
             return syllables_with_r
-        
-        # Check if the original word contains double RR pattern
-        word_has_double_rr = 'rr' in word_lower
-        
-        # Analyze each syllable for R sounds
-        current_pos = word_start
-        for syllable in syllables:
-            syllable_lower = syllable.lower()
-            
-            # Check if this syllable contains any R sound
-            if 'r' in syllable_lower:
-                # Calculate syllable position in original text
-                syllable_start = current_pos
-                syllable_end = current_pos + len(syllable)
-                
-                # Verify the syllable exists in the original text at this position
-                original_syllable = original_text[syllable_start:syllable_end]
-                if original_syllable.lower() == syllable_lower:
-                    # Determine difficulty and pattern type
-                    if word_has_double_rr:
-                        # This syllable is part of a word with double RR
-                        pattern_info = self.r_patterns['rr']
-                        pattern_type = 'double_rr'
-                    else:
-                        # This syllable has single R
-                        pattern_info = self.r_patterns['r']
-                        pattern_type = 'single_r'
-                    
-                    rr_syllable = RRSyllable(
-                        word=word,
-                        syllable=syllable,
-                        syllable_start=syllable_start,
-                        syllable_end=syllable_end,
-                        difficulty=pattern_info['difficulty'],
-                        pronunciation=pattern_info['pronunciation'],
-                        example=pattern_info['examples'][0] if pattern_info['examples'] else '',
-                        pattern_type=pattern_type  # Add pattern type for differentiation
-                    )
-                    syllables_with_r.append(rr_syllable)
-            
-            current_pos += len(syllable)
-        
+
+        # Pick the precomputed template for the pattern type
+        tpl = self._rr_tpl if word_info[1] else self._r_tpl
+
+        # Emit one RRSyllable per cached relative span: the spans were
+        # verified against the word when the cache entry was built, so each
+        # occurrence is just offset arithmetic plus a slice
+        for rel_start, rel_end in rel_spans:
+            syllable_start = word_start + rel_start
+            syllable_end = word_start + rel_end
+            rr_syllable = RRSyllable(word, original_text[syllable_start:syllable_end],
+                                     syllable_start, syllable_end, *tpl)
+            syllables_with_r.append(rr_syllable)
+
         return syllables_with_r
     
     def highlight_text(self, text: str, syllables: List[RRSyllable]) -> str:
@@ -187,95 +208,83 @@ class RRSoundDetector:
         """
         if not syllables:
             return text
-        
-        # Group syllables by word to process entire words
-        word_groups = {}
-        for syllable in syllables:
-            word = syllable.word.lower()
-            if word not in word_groups:
-                word_groups[word] = []
-            word_groups[word].append(syllable)
-        
-        # Create a list of characters with highlighting information
-        char_highlights = [None] * len(text)
-        
-        # Mark which characters should be highlighted and with what pattern
-        for syllable in syllables:
-            if (syllable.syllable_start >= 0 and 
-                syllable.syllable_end <= len(text) and 
-                syllable.syllable_start < syllable.syllable_end):
-                
-                # Mark each character in the syllable
-                for i in range(syllable.syllable_start, syllable.syllable_end):
-                    # Prefer double_rr over single_r if there's overlap
-                    if char_highlights[i] is None or syllable.pattern_type == 'double_rr':
-                        char_highlights[i] = syllable.pattern_type
-        
-        # Build the highlighted text with syllable-level RR highlighting
-        highlighted_text = ""
+
+        # Build the highlighted text with syllable-level RR highlighting.
+        # Fragments are collected in a list and joined once at the end:
+        # repeated str += is worst-case quadratic in the text length.
+        parts = []
         i = 0
-        
+        prev_bold = False
+
+        def emit(fragment, bold=False):
+            # Insert the separator between back-to-back dark-red runs as
+            # fragments are emitted, so no '****' fixup pass is needed later.
+            # NUL can never occur in user text, unlike the old literal 'X'
+            # which consumers had to strip (eating real Xs with it).
+            nonlocal prev_bold
+            if bold and prev_bold:
+                parts.append('\x00')
+            parts.append(fragment)
+            prev_bold = bold
+
         # Sort syllables by position to process them in order
         sorted_syllables = sorted(syllables, key=lambda x: x.syllable_start)
-        
+
         for syllable in sorted_syllables:
+            # Skip syllables that overlap an already-emitted region
+            if syllable.syllable_start < i:
+                continue
+
             # Add any text before this syllable
             if syllable.syllable_start > i:
-                highlighted_text += text[i:syllable.syllable_start]
-            
+                emit(text[i:syllable.syllable_start])
+
             # Get the syllable text
             syllable_text = text[syllable.syllable_start:syllable.syllable_end]
-            
+
             if syllable.pattern_type == 'double_rr':
                 # For double RR syllables, check if this syllable ends with R or starts with R
-                # This creates the RR pattern across syllable boundaries
-                r_positions = []
-                for pos, char in enumerate(syllable_text):
-                    if char.lower() == 'r':
-                        r_positions.append(pos)
-                
-                if len(r_positions) >= 1:
+                # This creates the RR pattern across syllable boundaries.
+                # One lowering plus two bounded byte searches (memchr) replace
+                # the old enumerate scan and startswith/endswith chain.
+                lower_bytes = syllable_text.lower().encode('latin-1', 'replace')
+                first_r = lower_bytes.find(_R_BYTE)
+
+                if first_r >= 0:
+                    last_r = lower_bytes.rfind(_R_BYTE)
                     # Check if this syllable ends with R (last character is R)
-                    if syllable_text.lower().endswith('r'):
+                    if last_r == len(syllable_text) - 1:
                         # Syllable ends with R - highlight the R in dark red
-                        r_pos = len(syllable_text) - 1
+                        r_pos = last_r
                         if r_pos > 0:
-                            highlighted_text += f"*{syllable_text[:r_pos]}*"  # Light red before R
-                        highlighted_text += f"**{syllable_text[r_pos:r_pos+1]}**"  # Dark red R (only one character)
-                    elif syllable_text.lower().startswith('r'):
+                            emit(f"*{syllable_text[:r_pos]}*")  # Light red before R
+                        emit(f"**{syllable_text[r_pos:r_pos+1]}**", bold=True)  # Dark red R (only one character)
+                    elif first_r == 0:
                         # Syllable starts with R - highlight the R in dark red
-                        r_pos = 0
-                        highlighted_text += f"**{syllable_text[r_pos:r_pos+1]}**"  # Dark red R
-                        if r_pos + 1 < len(syllable_text):
-                            highlighted_text += f"*{syllable_text[r_pos+1:]}*"  # Light red after R
+                        emit(f"**{syllable_text[0:1]}**", bold=True)  # Dark red R
+                        if len(syllable_text) > 1:
+                            emit(f"*{syllable_text[1:]}*")  # Light red after R
                     else:
                         # R is in the middle of the syllable
-                        r_pos = r_positions[0]
-                        if r_pos > 0:
-                            highlighted_text += f"*{syllable_text[:r_pos]}*"  # Light red before R
-                        highlighted_text += f"**{syllable_text[r_pos:r_pos+1]}**"  # Dark red R
+                        r_pos = first_r
+                        emit(f"*{syllable_text[:r_pos]}*")  # Light red before R
+                        emit(f"**{syllable_text[r_pos:r_pos+1]}**", bold=True)  # Dark red R
                         if r_pos + 1 < len(syllable_text):
-                            highlighted_text += f"*{syllable_text[r_pos+1:]}*"  # Light red after R
+                            emit(f"*{syllable_text[r_pos+1:]}*")  # Light red after R
                 else:
                     # No R in this syllable (shouldn't happen for double_rr pattern)
-                    highlighted_text += f"*{syllable_text}*"
+                    emit(f"*{syllable_text}*")
             else:
                 # For single R syllables, highlight the entire syllable in light red
-                highlighted_text += f"*{syllable_text}*"
-            
+                emit(f"*{syllable_text}*")
+
             i = syllable.syllable_end
-        
+
         # Add any remaining text after the last syllable
         if i < len(text):
-            highlighted_text += text[i:]
-        
-        # Add a unique marker between consecutive ** patterns to prevent merging
-        highlighted_text = highlighted_text.replace('****', '**X**')
-        
-        # Also handle the case where we have **r**X**r**
-        highlighted_text = highlighted_text.replace('**r**X**r**', '**r**X**r**')
-        
-        return highlighted_text
+            emit(text[i:])
+
+        return ''.join(parts)
     
     def get_statistics(self, syllables: List[RRSyllable]) -> Dict:
         """
@@ -287,25 +296,18 @@ class RRSoundDetector:
         Returns:
             Dictionary with statistics
         """
-        stats = {
+        # Single linear pass per field, counting at C level via Counter
+        difficulty_counts = Counter(s.difficulty for s in syllables)
+        pattern_counts = Counter(s.pattern_type for s in syllables)
+        unique_words = {s.word.lower() for s in syllables}
+
+        return {
             'total_patterns': len(syllables),
-            'by_difficulty': {},
-            'by_pattern_type': {'double_rr': 0, 'single_r': 0},
-            'unique_words': set()
+            'by_difficulty': dict(difficulty_counts),
+            'by_pattern_type': {'double_rr': pattern_counts.get('double_rr', 0),
+                                'single_r': pattern_counts.get('single_r', 0)},
+            'unique_words': len(unique_words)
         }
-        
-        for syllable in syllables:
-            # Count by difficulty
-            stats['by_difficulty'][syllable.difficulty] = stats['by_difficulty'].get(syllable.difficulty, 0) + 1
-            
-            # Count by pattern type
-            stats['by_pattern_type'][syllable.pattern_type] += 1
-            
-            # Collect unique words
-            stats['unique_words'].add(syllable.word.lower())
-        
-        stats['unique_words'] = len(stats['unique_words'])
-        return stats
     
     def analyze_text(self, text: str) -> Dict:
         """
@@ -328,6 +330,25 @@ class RRSoundDetector:
             'statistics': stats
         }
 
+    def analyze_texts(self, texts: List[str]) -> List[Dict]:
+        """
+        Analyze a batch of texts, sharing the syllable cache across all of them.
+
+        Args:
+            texts: List of Portuguese texts to analyze
+
+        Returns:
+            List of per-text analysis dictionaries (same shape as analyze_text)
+        """
+        # Prewarm the syllable cache on the combined vocabulary so every
+        # document after the first mostly hits the cache
+        vocab = {word.lower() for text in texts for word in _WORD_RE.findall(text)}
+        for word in vocab:
+            if 'r' in word:
+                self._syl_cache(word)
+
+        return [self.analyze_text(text) for text in texts]
+
 def test_rr_detector():
     """Test the RR sound detector with sample Portuguese text."""
     detector = RRSoundDetector()
@@ -1,5 +1,5 @@
 import streamlit as st
-from portuguese_syllabifier_nltk import PortugueseSyllabifierNLTK
+from portuguese_syllabifier_nltk import get_shared_syllabifier
 
 # Page configuration
 st.set_page_config(
@@ -11,7 +11,7 @@ st.set_page_config(
 # Initialize the syllabifier
 @st.cache_resource
 def get_syllabifier():
-    return PortugueseSyllabifierNLTK()
+    return get_shared_syllabifier()
 
 def main():
     st.title("🇵🇹 Portuguese Syllabifier")
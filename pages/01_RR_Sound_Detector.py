@@ -1,10 +1,101 @@
+import re
 import streamlit as st
 import sys
 import os
 
-# Add the RR_sounds directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'RR_sounds'))
-from rr_sound_separator import RRSoundDetector
+# Put the project root on sys.path exactly once so RR_sounds imports as a
+# package; an unguarded append grows sys.path on every Streamlit rerun and
+# slows down all subsequent imports
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+from RR_sounds.rr_sound_separator import RRSoundDetector
+
+# Characters the markup scanner has to stop at; everything between two
+# occurrences is plain text and can be copied in bulk
+_MARKUP_SPECIAL = re.compile(r'[*`\x00]')
+
+# Span templates for the two highlighting styles
+_BOX_DOUBLE = '<span style="background-color: #d32f2f; color: white; padding: 2px 4px; border-radius: 3px; font-weight: bold;">{}</span>'
+_BOX_SINGLE = '<span style="background-color: #ff6b6b; color: white; padding: 2px 4px; border-radius: 3px;">{}</span>'
+_BOX_BACKTICK = '<span style="background-color: #66bb6a; color: white; padding: 2px 4px; border-radius: 3px; font-family: monospace;">{}</span>'
+_COLOR_DOUBLE = '<span style="color: #d32f2f; font-weight: bold;">{}</span>'
+_COLOR_SINGLE = '<span style="color: #ff6b6b;">{}</span>'
+_COLOR_BACKTICK = '<span style="color: #66bb6a; font-family: monospace;">{}</span>'
+
+# Translation table for the newline -> <br> conversion of the final HTML
+_NL_TABLE = str.maketrans({'\n': '<br>'})
+
+# Outer wrapper for the highlighted text display, built once
+_WRAP_TEMPLATE = (
+    '<div style="background-color: #ffffff; padding: 20px; border-radius: 10px; '
+    'border: 2px solid #e0e0e0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">'
+    '<div style="font-size: 18px; line-height: 1.6; color: #333;">{body}</div>'
+    '</div>'
+)
+
+# Display labels resolved via dict lookup instead of per-row branching
+_PT_DISPLAY = {'double_rr': 'Double RR', 'single_r': 'Single R'}
+_DIFF_LABELS = {
+    'hard': ('Hard', 'Double RR, R at start/end'),
+    'medium': ('Medium', 'R in consonant clusters'),
+    'easy': ('Easy', 'R between vowels'),
+}
+
+def _render_markup(markup: str, box: bool) -> str:
+    """
+    Convert detector highlight markup to HTML in a single forward scan.
+
+    Emits fragments into a list and joins once, instead of materializing a
+    fresh full-length string per replace/sub pass. The NUL separators the
+    detector places between back-to-back bold runs are skipped inline.
+    """
+    double_tpl = _BOX_DOUBLE if box else _COLOR_DOUBLE
+    single_tpl = _BOX_SINGLE if box else _COLOR_SINGLE
+    backtick_tpl = _BOX_BACKTICK if box else _COLOR_BACKTICK
+
+    out = []
+    i = 0
+    n = len(markup)
+    while i < n:
+        # Jump over the plain-text run in one C-level search instead of
+        # appending character by character
+        match = _MARKUP_SPECIAL.search(markup, i)
+        if match is None:
+            out.append(markup[i:])
+            break
+        if match.start() > i:
+            out.append(markup[i:match.start()])
+            i = match.start()
+
+        ch = markup[i]
+        if ch == '*':
+            if markup.startswith('**', i):
+                end = markup.find('**', i + 2)
+                if end > i + 2:
+                    out.append(double_tpl.format(markup[i + 2:end]))
+                    i = end + 2
+                    continue
+            else:
+                end = markup.find('*', i + 1)
+                if end > i + 1:
+                    out.append(single_tpl.format(markup[i + 1:end]))
+                    i = end + 1
+                    continue
+        elif ch == '`':
+            end = markup.find('`', i + 1)
+            if end > i + 1:
+                out.append(backtick_tpl.format(markup[i + 1:end]))
+                i = end + 1
+                continue
+        elif ch == '\x00':
+            # Separator between bold runs — drop it without an extra pass
+            i += 1
+            continue
+        out.append(ch)
+        i += 1
+
+    return ''.join(out)
 
 # Page configuration
 st.set_page_config(
@@ -18,39 +109,58 @@ st.set_page_config(
 def get_rr_detector():
     return RRSoundDetector()
 
+@st.cache_data(max_entries=256, show_spinner=False)
+def _analyze(text: str) -> dict:
+    """Run the RR analysis, cached on the input text alone so toggling the
+    highlight style never re-runs the NLP pass."""
+    return get_rr_detector().analyze_text(text)
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _render(text: str, highlight_mode: str):
+    """Analyze a text and render its highlight HTML, cached per (text, mode)."""
+    analysis = _analyze(text)
+
+    # Single forward scan converts the markup straight to HTML
+    highlighted_html = _render_markup(analysis['highlighted_text'],
+                                      highlight_mode == "Box Highlight")
+
+    return analysis, highlighted_html
+
 def main():
     st.title("🔤 Portuguese RR Sound Detector")
     st.markdown("*Find and highlight difficult R sounds for children*")
     st.markdown("---")
     
-    # Initialize RR detector
-    detector = get_rr_detector()
-    
     # Input section
     st.subheader("Enter Portuguese text:")
     
-    # Simple text input that responds to Enter key
-    text = st.text_area(
-        "Text:",
-        placeholder="Enter Portuguese text to analyze for RR patterns... (Press Enter to submit)",
-        height=150,
-        key="text_input"
-    )
-    
-    # Highlighting mode toggle
-    st.markdown("**🎨 Highlighting Style:**")
-    highlight_mode = st.radio(
-        "Choose highlighting style:",
-        ["Box Highlight", "Color Only"],
-        horizontal=True,
-        help="Box Highlight: Syllables with colored backgrounds. Color Only: Syllables with colored text only."
-    )
-    
-    # Process when text is entered and Enter is pressed
-    if text and text.strip():
+    # Collect all inputs in a form: the script only reruns on submit,
+    # not on every keystroke or widget event
+    with st.form("rr_form", clear_on_submit=False):
+        text = st.text_area(
+            "Text:",
+            placeholder="Enter Portuguese text to analyze for RR patterns...",
+            height=150,
+            key="text_input"
+        )
+
+        # Highlighting mode toggle
+        st.markdown("**🎨 Highlighting Style:**")
+        highlight_mode = st.radio(
+            "Choose highlighting style:",
+            ["Box Highlight", "Color Only"],
+            horizontal=True,
+            help="Box Highlight: Syllables with colored backgrounds. Color Only: Syllables with colored text only."
+        )
+
+        submitted = st.form_submit_button("Analyze")
+
+    # Process only when the form is submitted
+    if submitted and text and text.strip():
         try:
-            # Analyze the text
-            analysis = detector.analyze_text(text.strip())
+            # Analyze and render, cached so reruns with unchanged inputs
+            # (e.g. unrelated widget events) are O(1) lookups
+            analysis, highlighted_html = _render(text.strip(), highlight_mode)
             
             # Highlighted text (moved to appear first)
             st.markdown("---")
@@ -60,56 +170,9 @@ def main():
             else:
                 st.markdown("*Legend: 🔴 Dark Red Text = Double RR patterns, 🔴 Red Text = Single R patterns*")
             
-            # Create better highlighted text with custom colors
-            highlighted_html = analysis['highlighted_text']
-            
-            # Replace markdown formatting with custom HTML colors using a more robust approach
-            import re
-            
-            # First, protect double asterisks by replacing them with a temporary marker
-            highlighted_html = highlighted_html.replace('**', 'DOUBLE_ASTERISK')
-            
-            if highlight_mode == "Box Highlight":
-                # Box highlighting mode - colored backgrounds
-                # First, restore double asterisks and remove separator
-                highlighted_html = highlighted_html.replace('DOUBLE_ASTERISK', '**')
-                highlighted_html = highlighted_html.replace('X', '')
-                
-                # Process double asterisks first (dark red)
-                while '**' in highlighted_html:
-                    # Handle the case where there might be empty content between **
-                    highlighted_html = re.sub(r'\*\*([^*]+?)\*\*', r'<span style="background-color: #d32f2f; color: white; padding: 2px 4px; border-radius: 3px; font-weight: bold;">\1</span>', highlighted_html, count=1)
-                
-                # Then process single asterisks (light red)
-                highlighted_html = re.sub(r'\*(.*?)\*', r'<span style="background-color: #ff6b6b; color: white; padding: 2px 4px; border-radius: 3px;">\1</span>', highlighted_html)
-                
-                # Easy patterns: Green background (replace `text` with span)
-                highlighted_html = re.sub(r'`(.*?)`', r'<span style="background-color: #66bb6a; color: white; padding: 2px 4px; border-radius: 3px; font-family: monospace;">\1</span>', highlighted_html)
-            else:
-                # Color only mode - colored text without backgrounds
-                # First, restore double asterisks and remove separator
-                highlighted_html = highlighted_html.replace('DOUBLE_ASTERISK', '**')
-                highlighted_html = highlighted_html.replace('X', '')
-                
-                # Process double asterisks first (dark red)
-                while '**' in highlighted_html:
-                    # Handle the case where there might be empty content between **
-                    highlighted_html = re.sub(r'\*\*([^*]+?)\*\*', r'<span style="color: #d32f2f; font-weight: bold;">\1</span>', highlighted_html, count=1)
-                
-                # Then process single asterisks (light red)
-                highlighted_html = re.sub(r'\*(.*?)\*', r'<span style="color: #ff6b6b;">\1</span>', highlighted_html)
-                
-                # Easy patterns: Green text (replace `text` with span)
-                highlighted_html = re.sub(r'`(.*?)`', r'<span style="color: #66bb6a; font-family: monospace;">\1</span>', highlighted_html)
-            
             # Display highlighted text in a nice box
-            st.markdown(f"""
-            <div style="background-color: #ffffff; padding: 20px; border-radius: 10px; border: 2px solid #e0e0e0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-            <div style="font-size: 18px; line-height: 1.6; color: #333;">
-            {highlighted_html.replace(chr(10), '<br>')}
-            </div>
-            </div>
-            """, unsafe_allow_html=True)
+            body = highlighted_html.translate(_NL_TABLE)
+            st.markdown(_WRAP_TEMPLATE.format(body=body), unsafe_allow_html=True)
             
             # Analysis Results (moved to appear after highlighted text)
             st.markdown("---")
@@ -127,15 +190,11 @@ def main():
             
             # Difficulty breakdown
             st.markdown("**📈 By Difficulty:**")
-            difficulty_cols = st.columns(len(analysis['statistics']['by_difficulty']))
-            for i, (difficulty, count) in enumerate(analysis['statistics']['by_difficulty'].items()):
-                with difficulty_cols[i]:
-                    if difficulty == 'hard':
-                        st.metric("Hard", count, help="Double RR, R at start/end")
-                    elif difficulty == 'medium':
-                        st.metric("Medium", count, help="R in consonant clusters")
-                    else:
-                        st.metric("Easy", count, help="R between vowels")
+            by_difficulty = analysis['statistics']['by_difficulty']
+            for col, difficulty in zip(st.columns(3), ('hard', 'medium', 'easy')):
+                with col:
+                    label, help_text = _DIFF_LABELS[difficulty]
+                    st.metric(label, by_difficulty.get(difficulty, 0), help=help_text)
             
             # Pattern type breakdown
             st.markdown("**🔍 R Sound Types:**")
@@ -153,27 +212,25 @@ def main():
             if analysis['patterns']:
                 st.markdown("---")
                 st.subheader("📝 Detected Patterns:")
-                
+
+                # Native <details> blocks collapse like st.expander but ship
+                # as one markdown payload instead of two widgets per pattern
+                rows = []
                 for i, syllable in enumerate(analysis['patterns'], 1):
-                    # Safe access to pattern_type with fallback
-                    pattern_type = getattr(syllable, 'pattern_type', 'single_r')
-                    pattern_type_display = "Double RR" if pattern_type == 'double_rr' else "Single R"
-                    with st.expander(f"{i}. '{syllable.word}' -> '{syllable.syllable}' ({pattern_type_display})"):
-                        col1, col2 = st.columns([1, 2])
-                        with col1:
-                            st.markdown("**Word:**")
-                            st.markdown("**Syllable:**")
-                            st.markdown("**Pattern Type:**")
-                            st.markdown("**Difficulty:**")
-                            st.markdown("**Pronunciation:**")
-                            st.markdown("**Example:**")
-                        with col2:
-                            st.markdown(syllable.word)
-                            st.markdown(syllable.syllable)
-                            st.markdown(pattern_type_display)
-                            st.markdown(syllable.difficulty)
-                            st.markdown(syllable.pronunciation)
-                            st.markdown(syllable.example)
+                    # RRSyllable always carries pattern_type, so no fallback probe
+                    pattern_type_display = _PT_DISPLAY.get(syllable.pattern_type, 'Single R')
+                    rows.append(
+                        f"<details><summary>{i}. '{syllable.word}' -> '{syllable.syllable}' ({pattern_type_display})</summary>"
+                        f"<table>"
+                        f"<tr><th>Word</th><td>{syllable.word}</td></tr>"
+                        f"<tr><th>Syllable</th><td>{syllable.syllable}</td></tr>"
+                        f"<tr><th>Pattern Type</th><td>{pattern_type_display}</td></tr>"
+                        f"<tr><th>Difficulty</th><td>{syllable.difficulty}</td></tr>"
+                        f"<tr><th>Pronunciation</th><td>{syllable.pronunciation}</td></tr>"
+                        f"<tr><th>Example</th><td>{syllable.example}</td></tr>"
+                        f"</table></details>"
+                    )
+                st.markdown(''.join(rows), unsafe_allow_html=True)
             
         except Exception as e:
             st.error(f"Error processing text: {str(e)}")
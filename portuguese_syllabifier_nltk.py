@@ -1,6 +1,121 @@
 import re
-import nltk
-from typing import List, Tuple, Dict, Set
+from bisect import insort
+from functools import lru_cache
+from sys import intern
+from typing import List, Tuple, Dict, Sequence, Set
+
+# Patterns used on the hot per-word path, compiled once at import time
+# instead of going through re's bounded pattern cache on every call.
+# "gu"/"qu" before e/i is an inseparable digraph when followed by a
+# consonant or the end of the word.
+_GQ_PAT = re.compile(r'[gq]u[ei](?=[bcdfghjklmnpqrstvwxyz]|$)', re.IGNORECASE)
+_PUNCT_PAT = re.compile(r'[^\w\s]')
+# Word-or-punctuation tokenizer: runs of word characters (keeping internal
+# hyphens and apostrophes) or a single punctuation character. The downstream
+# code only distinguishes word-like tokens from everything else, so a full
+# Punkt/Treebank tokenizer would be wasted work.
+_TOKEN_PAT = re.compile(r"[\w'\-]+|[^\w\s]")
+# Only hyphens split words; apostrophe words (d'agua) must reach the
+# special-patterns table whole. The capture group keeps each separator in
+# the split output so it can be re-emitted in place.
+_HYPH_PAT = re.compile(r'(-)')
+
+# Portuguese vowels (case-insensitive) - including 'y' for foreign words/names
+_VOWEL_CHARS = 'aeiouáâãàéêèíîìóôõòúûùy'
+
+# Maps every vowel (either case) to \x01 so one str.translate call produces a
+# per-character vowel mask; its latin-1 bytes are then scanned with bytes.find
+# in C instead of a per-character Python loop.
+_VOWEL_MASK = str.maketrans(dict.fromkeys(
+    _VOWEL_CHARS + _VOWEL_CHARS.upper(), '\x01'))
+
+# 256-entry table: _IS_VOWEL[ord(c)] is 1 for a latin-1 vowel of either case,
+# so single-character classification is one C-level byte index instead of a
+# lower() call plus a set probe. All Portuguese vowels are latin-1.
+_IS_VOWEL = bytes(1 if chr(i).lower() in _VOWEL_CHARS else 0 for i in range(256))
+
+def _inseparable_gq(word: str) -> frozenset:
+    """Return the index of every g/q that begins an inseparable gu/qu digraph."""
+    if 'gu' in word or 'qu' in word:
+        return frozenset(m.start() for m in _GQ_PAT.finditer(word))
+    return frozenset()
+
+# Only truly irregular words that can't be handled by rules. The table is
+# fully static, so it is built once at import time; values are tuples so a
+# single frozen object is shared by every lookup.
+_SPECIAL_PATTERNS: Dict[str, Tuple[str, ...]] = {
+        # Complex medical/technical terms
+        'otorrinolaringologista': ('o', 'tor', 'ri', 'no', 'la', 'rin', 'go', 'lo', 'gis', 'ta'),
+        'pneumoultramicroscopicossilicovulcanoconiótico': ('pneu', 'moul', 'tra', 'mi', 'cros', 'co', 'pi', 'co', 'ssi', 'li', 'co', 'vul', 'ca', 'no', 'co', 'ni', 'ó', 'ti', 'co'),
+        'gastroenterologista': ('gas', 'tro', 'en', 'te', 'ro', 'lo', 'gis', 'ta'),
+        'cardiologista': ('car', 'di', 'o', 'lo', 'gis', 'ta'),
+        'neurologista': ('neu', 'ro', 'lo', 'gis', 'ta'),
+        'dermatologista': ('der', 'ma', 'to', 'lo', 'gis', 'ta'),
+        'oftalmologista': ('of', 'tal', 'mo', 'lo', 'gis', 'ta'),
+        'ortopedista': ('or', 'to', 'pe', 'dis', 'ta'),
+        'urologista': ('u', 'ro', 'lo', 'gis', 'ta'),
+        
+        # Irregular words with special patterns
+        'idéia': ('i', 'déi', 'a'),
+        "d'água": ("d'", 'á', 'gua'),
+        "n'água": ("n'", 'á', 'gua'),
+        
+        # Foreign words
+        'springy': ('sprin', 'gy'),
+        'scrawls': ('scrawls',),
+        
+        # Complex irregular words
+        'anticonstitucionalissimamente': ('an', 'ti', 'cons', 'ti', 'tu', 'ci', 'o', 'na', 'lis', 'si', 'ma', 'men', 'te'),
+        'psiquiatra': ('psi', 'qui', 'a', 'tra'),
+        
+        # Special cases that need custom handling
+        'estrela': ('es', 'tre', 'la'),
+        'transporte': ('trans', 'por', 'te'),
+        'reconstruir': ('re', 'cons', 'tru', 'ir'),
+        'cooperar': ('co', 'o', 'pe', 'rar'),
+        'coordenar': ('co', 'or', 'de', 'nar'),
+        'coordenacao': ('co', 'or', 'de', 'na', 'cao'),
+        'coordenador': ('co', 'or', 'de', 'na', 'dor'),
+        'coordenadora': ('co', 'or', 'de', 'na', 'do', 'ra'),
+        'coordenadamente': ('co', 'or', 'de', 'na', 'da', 'men', 'te'),
+        
+        # Common "qu" words that need special handling
+        'aquarela': ('a', 'qua', 're', 'la'),
+        'aquarelista': ('a', 'qua', 're', 'lis', 'ta'),
+        'aquario': ('a', 'qua', 'ri', 'o'),
+        'aquatico': ('a', 'qua', 'ti', 'co'),
+        'aquecer': ('a', 'que', 'cer'),
+        'aquecimento': ('a', 'que', 'ci', 'men', 'to'),
+        'aqueduto': ('a', 'que', 'du', 'to'),
+        'aquela': ('a', 'que', 'la'),
+        'aquele': ('a', 'que', 'le'),
+        'aquem': ('a', 'quem'),
+        'aqui': ('a', 'qui'),
+        'aquiescencia': ('a', 'qui', 'es', 'cen', 'ci', 'a'),
+        'aquiescer': ('a', 'qui', 'es', 'cer'),
+        'aquietar': ('a', 'qui', 'e', 'tar'),
+        'aquilatacao': ('a', 'qui', 'la', 'ta', 'cao'),
+        'aquilatar': ('a', 'qui', 'la', 'tar'),
+        'aquilino': ('a', 'qui', 'li', 'no'),
+        'aquilo': ('a', 'qui', 'lo'),
+        'aquinhoar': ('a', 'qui', 'nho', 'ar'),
+        'aquisicao': ('a', 'qui', 'si', 'cao'),
+        'aquisitivo': ('a', 'qui', 'si', 'ti', 'vo'),
+        'aquoso': ('a', 'quo', 'so'),
+        
+        # Special cases for "gu" and "qu" words that need custom handling
+        'guerrilha': ('guer', 'ri', 'lha'),
+        'guerrilheiro': ('guer', 'ri', 'lhei', 'ro'),
+        'guerrilheira': ('guer', 'ri', 'lhei', 'ra'),
+        'guerrilheirismo': ('guer', 'ri', 'lhei', 'ris', 'mo'),
+}
+
+# Intern the stored syllables: fragments like 'ta', 'co' and 'lo' repeat
+# across many entries, so they collapse to one shared str object apiece.
+_SPECIAL_PATTERNS = {
+    word: tuple(intern(syllable) for syllable in syllables)
+    for word, syllables in _SPECIAL_PATTERNS.items()
+}
 
 class PortugueseSyllabifierNLTK:
     """
@@ -8,157 +123,66 @@ class PortugueseSyllabifierNLTK:
     Based on Portuguese grammar and linguistic principles.
     """
     
+    # All rule tables are static, so they live on the class as frozensets:
+    # built once per process and shared by every instance.
+
+    vowels = frozenset(_VOWEL_CHARS)
+
+    # Diphthongs (case-insensitive) - these are single syllables
+    diphthongs = frozenset({
+        'ai', 'au', 'ei', 'eu', 'oi', 'ou', 'ui', 'iu',
+        'ão', 'ãe', 'õe', 'õa', 'ãi', 'õi'  # Nasal diphthongs
+    })
+
+    # Imperfect consonant clusters (inseparable)
+    imperfect_clusters = frozenset({
+        'br', 'bl', 'cr', 'cl', 'dr', 'dl', 'fr', 'fl', 'gr', 'gl', 'pr', 'pl', 'tr', 'tl', 'vr', 'vl'
+    })
+
+    # Digraphs (inseparable)
+    digraphs = frozenset({
+        'nh', 'lh', 'ch', 'gu', 'qu'
+    })
+
+    # Separable digraphs (should be separated)
+    separable_digraphs = frozenset({
+        'ss', 'rr', 'sc', 'xc', 'xs'
+    })
+
+    # Perfect consonant clusters (separable)
+    perfect_clusters = frozenset({
+        'st', 'sp', 'sc', 'sm', 'sn', 'sl', 'sr',
+        'pt', 'pc', 'pm', 'pn', 'pl', 'pr',
+        'ct', 'cp', 'cm', 'cn', 'cl', 'cr',
+        'mt', 'mp', 'mc', 'mn', 'ml', 'mr',
+        'nt', 'np', 'nc', 'nm', 'nl', 'nr'
+    })
+
+    # Complex consonant clusters (3+ consonants)
+    complex_clusters = frozenset({
+        'str', 'spr', 'scr', 'spl'
+    })
+
+    # Common prefixes (case-insensitive)
+    prefixes = frozenset({
+        'a', 'ab', 'abs', 'ad', 'ante', 'anti', 'auto', 'bi', 'co', 'com', 'con', 'contra',
+        'de', 'des', 'dis', 'e', 'em', 'en', 'entre', 'ex', 'extra', 'hiper', 'in', 'im',
+        'inter', 'intra', 'ir', 'macro', 'micro', 'mini', 'multi', 'neo', 'para', 'per', 'peri',
+        'poly', 'post', 'pre', 'pro', 're', 'semi', 'sub', 'super', 'tele', 'trans', 'ultra',
+        'uni', 'vice'
+    })
+
+    special_patterns = _SPECIAL_PATTERNS
+
     def __init__(self):
-        # Download necessary NLTK data
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt')
-        
-        # Portuguese vowels (case-insensitive) - including 'y' for foreign words/names
-        self.vowels = set('aeiouáâãàéêèíîìóôõòúûùy')
-        
-        # Diphthongs (case-insensitive) - these are single syllables
-        self.diphthongs = {
-            'ai', 'au', 'ei', 'eu', 'oi', 'ou', 'ui', 'iu',
-            'ão', 'ãe', 'õe', 'õa', 'ãi', 'õi'  # Nasal diphthongs
-        }
-        
-        # Imperfect consonant clusters (inseparable)
-        self.imperfect_clusters = {
-            'br', 'bl', 'cr', 'cl', 'dr', 'dl', 'fr', 'fl', 'gr', 'gl', 'pr', 'pl', 'tr', 'tl', 'vr', 'vl'
-        }
-        
-        # Digraphs (inseparable)
-        self.digraphs = {
-            'nh', 'lh', 'ch', 'gu', 'qu'
-        }
-        
-        # Separable digraphs (should be separated)
-        self.separable_digraphs = {
-            'ss', 'rr', 'sc', 'xc', 'xs'
-        }
-        
-        # Perfect consonant clusters (separable)
-        self.perfect_clusters = {
-            'st', 'sp', 'sc', 'sm', 'sn', 'sl', 'sr',
-            'pt', 'pc', 'pm', 'pn', 'pl', 'pr',
-            'ct', 'cp', 'cm', 'cn', 'cl', 'cr',
-            'mt', 'mp', 'mc', 'mn', 'ml', 'mr',
-            'nt', 'np', 'nc', 'nm', 'nl', 'nr'
-        }
-        
-        # Complex consonant clusters (3+ consonants)
-        self.complex_clusters = {
-            'str', 'spr', 'scr', 'spl'
-        }
-        
-        # Common prefixes (case-insensitive)
-        self.prefixes = {
-            'a', 'ab', 'abs', 'ad', 'ante', 'anti', 'auto', 'bi', 'co', 'com', 'con', 'contra',
-            'de', 'des', 'dis', 'e', 'em', 'en', 'entre', 'ex', 'extra', 'hiper', 'in', 'im',
-            'inter', 'intra', 'ir', 'macro', 'micro', 'mini', 'multi', 'neo', 'para', 'per', 'peri',
-            'poly', 'post', 'pre', 'pro', 're', 'semi', 'sub', 'super', 'tele', 'trans', 'ultra',
-            'uni', 'vice'
-        }
-        
-        # Only truly irregular words that can't be handled by rules
-        self.special_patterns = {
-            # Complex medical/technical terms
-            'otorrinolaringologista': ['o', 'tor', 'ri', 'no', 'la', 'rin', 'go', 'lo', 'gis', 'ta'],
-            'pneumoultramicroscopicossilicovulcanoconiótico': ['pneu', 'moul', 'tra', 'mi', 'cros', 'co', 'pi', 'co', 'ssi', 'li', 'co', 'vul', 'ca', 'no', 'co', 'ni', 'ó', 'ti', 'co'],
-            'gastroenterologista': ['gas', 'tro', 'en', 'te', 'ro', 'lo', 'gis', 'ta'],
-            'cardiologista': ['car', 'di', 'o', 'lo', 'gis', 'ta'],
-            'neurologista': ['neu', 'ro', 'lo', 'gis', 'ta'],
-            'dermatologista': ['der', 'ma', 'to', 'lo', 'gis', 'ta'],
-            'oftalmologista': ['of', 'tal', 'mo', 'lo', 'gis', 'ta'],
-            'ortopedista': ['or', 'to', 'pe', 'dis', 'ta'],
-            'urologista': ['u', 'ro', 'lo', 'gis', 'ta'],
-            
-            # Irregular words with special patterns
-            'idéia': ['i', 'déi', 'a'],
-            "d'água": ["d'", 'á', 'gua'],
-            "n'água": ["n'", 'á', 'gua'],
-            
-            # Foreign words
-            'springy': ['sprin', 'gy'],
-            'scrawls': ['scrawls'],
-            
-            # Complex irregular words
-            'anticonstitucionalissimamente': ['an', 'ti', 'cons', 'ti', 'tu', 'ci', 'o', 'na', 'lis', 'si', 'ma', 'men', 'te'],
-            'psiquiatra': ['psi', 'qui', 'a', 'tra'],
-            
-            # Special cases that need custom handling
-            'estrela': ['es', 'tre', 'la'],
-            'transporte': ['trans', 'por', 'te'],
-            'reconstruir': ['re', 'cons', 'tru', 'ir'],
-            'cooperar': ['co', 'o', 'pe', 'rar'],
-            'coordenar': ['co', 'or', 'de', 'nar'],
-            'coordenacao': ['co', 'or', 'de', 'na', 'cao'],
-            'coordenador': ['co', 'or', 'de', 'na', 'dor'],
-            'coordenadora': ['co', 'or', 'de', 'na', 'do', 'ra'],
-            'coordenadamente': ['co', 'or', 'de', 'na', 'da', 'men', 'te'],
-            
-            # Common "qu" words that need special handling
-            'aquarela': ['a', 'qua', 're', 'la'],
-            'aquarelista': ['a', 'qua', 're', 'lis', 'ta'],
-            'aquario': ['a', 'qua', 'ri', 'o'],
-            'aquatico': ['a', 'qua', 'ti', 'co'],
-            'aquecer': ['a', 'que', 'cer'],
-            'aquecimento': ['a', 'que', 'ci', 'men', 'to'],
-            'aqueduto': ['a', 'que', 'du', 'to'],
-            'aquela': ['a', 'que', 'la'],
-            'aquele': ['a', 'que', 'le'],
-            'aquem': ['a', 'quem'],
-            'aqui': ['a', 'qui'],
-            'aquiescencia': ['a', 'qui', 'es', 'cen', 'ci', 'a'],
-            'aquiescer': ['a', 'qui', 'es', 'cer'],
-            'aquietar': ['a', 'qui', 'e', 'tar'],
-            'aquilatacao': ['a', 'qui', 'la', 'ta', 'cao'],
-            'aquilatar': ['a', 'qui', 'la', 'tar'],
-            'aquilino': ['a', 'qui', 'li', 'no'],
-            'aquilo': ['a', 'qui', 'lo'],
-            'aquinhoar': ['a', 'qui', 'nho', 'ar'],
-            'aquisicao': ['a', 'qui', 'si', 'cao'],
-            'aquisitivo': ['a', 'qui', 'si', 'ti', 'vo'],
-            'aquoso': ['a', 'quo', 'so'],
-            
-            # Special cases for "gu" and "qu" words that need custom handling
-            'guerrilha': ['guer', 'ri', 'lha'],
-            'guerrilheiro': ['guer', 'ri', 'lhei', 'ro'],
-            'guerrilheira': ['guer', 'ri', 'lhei', 'ra'],
-            'guerrilheirismo': ['guer', 'ri', 'lhei', 'ris', 'mo'],
-        }
-    
+        # Memoize the case-insensitive rule engine per word: natural text
+        # repeats words heavily, so most tokens become a single dict hit
+        self._syl_cache = lru_cache(maxsize=65536)(self._syllabify_lower)
+
     def is_vowel(self, char: str) -> bool:
         """Check if character is a Portuguese vowel."""
-        return char.lower() in self.vowels
-    
-    def preprocess_gq_digraphs(self, word: str) -> str:
-        """
-        Pre-process "gu" and "qu" digraphs by marking them with special characters.
-        This ensures they are treated as inseparable units.
-        """
-        # Replace "gu" + "e" or "i" with "g̃u" to mark as inseparable
-        # But only when followed by a consonant or end of word
-        word = re.sub(r'gu([ei])(?=[bcdfghjklmnpqrstvwxyz]|$)', r'g̃u\1', word, flags=re.IGNORECASE)
-        
-        # Replace "qu" + "e" or "i" with "q̃u" to mark as inseparable
-        # But only when followed by a consonant or end of word
-        word = re.sub(r'qu([ei])(?=[bcdfghjklmnpqrstvwxyz]|$)', r'q̃u\1', word, flags=re.IGNORECASE)
-        
-        return word
-    
-    def postprocess_gq_digraphs(self, syllables: List[str]) -> List[str]:
-        """
-        Post-process syllables to restore original "gu" and "qu" from marked versions.
-        """
-        result = []
-        for syllable in syllables:
-            # Restore "g̃u" to "gu" and "q̃u" to "qu"
-            syllable = syllable.replace('g̃', 'g').replace('q̃', 'q')
-            result.append(syllable)
-        return result
+        code = ord(char)
+        return code < 256 and _IS_VOWEL[code] == 1
     
     def syllabify(self, word: str) -> List[str]:
         """
@@ -172,30 +196,23 @@ class PortugueseSyllabifierNLTK:
             return self.handle_hyphenated_word(word)
         
         # Remove punctuation and normalize
-        word = re.sub(r'[^\w\s]', '', word)
+        word = _PUNCT_PAT.sub('', word)
         
         # Apply comprehensive syllabification algorithm
         return self.apply_comprehensive_algorithm(word)
     
     def handle_hyphenated_word(self, word: str) -> List[str]:
         """Handle words with hyphens or apostrophes."""
-        # Split by hyphens and apostrophes
-        parts = re.split(r'[-'']', word)
-        
-        syllabifier = PortugueseSyllabifierNLTK()
         result = []
         
-        for i, part in enumerate(parts):
-            if part:  # Skip empty parts
-                syllables = syllabifier.apply_comprehensive_algorithm(part)
-                result.extend(syllables)
-            
-            # Add hyphen or apostrophe back (except for the last part)
-            if i < len(parts) - 1:
-                if '-' in word:
-                    result.append('-')
-                elif "'" in word:
-                    result.append("'")
+        # The capturing split interleaves parts and separators, so each
+        # separator is emitted in place without re-scanning the word
+        for i, part in enumerate(_HYPH_PAT.split(word)):
+            if i % 2:
+                # Odd indices are the captured separators
+                result.append(part)
+            elif part:  # Skip empty parts
+                result.extend(self.apply_comprehensive_algorithm(part))
         
         return result
     
@@ -203,76 +220,73 @@ class PortugueseSyllabifierNLTK:
         """
         Apply comprehensive syllabification algorithm based on Portuguese phonological rules.
         """
-        # Store original case for restoration
-        original_case = self.get_case_type(word)
-        
+        syllables, branch = self._syl_cache(word.lower())
+        if branch == 'cao':
+            # The "ção"/"cao" ending keeps its original case while the base
+            # syllables stay lowercase (no case restoration on this branch)
+            return [*syllables[:-1], word[-3:]]
+        if branch == 'cao-short':
+            # Very short base word: both pieces keep their original case
+            return [word[:-3], word[-3:]]
+        return self.restore_case(word, syllables)
+
+    def _syllabify_lower(self, word_lower: str) -> Tuple[Tuple[str, ...], str]:
+        """Run the case-insensitive part of the rule engine on a lowercase word.
+
+        Returns the syllables plus the branch taken, so the caller can reapply
+        the case-sensitive finishing touches without re-running the rules.
+        """
         # Step 1: Check for special patterns first
-        word_lower = word.lower()
         if word_lower in self.special_patterns:
-            return self.restore_case(word, self.special_patterns[word_lower])
-        
+            return self.special_patterns[word_lower], 'special'
+
         # Step 2: Handle words ending in "CAO" or "ção" (Portuguese "ção" sound)
-        if word.lower().endswith('cao') or word.lower().endswith('ção'):
-            return self.handle_cao_words(word)
-        
-        # Step 3: Normalize word for processing
-        normalized = word.lower()
-        
-        # Step 4: Apply syllabification rules
-        syllables = self.apply_syllabification_rules(normalized)
-        
-        # Step 5: Restore original case
-        return self.restore_case(word, syllables)
-    
+        if word_lower.endswith('cao') or word_lower.endswith('ção'):
+            base_word = word_lower[:-3]
+            if len(base_word) <= 2:
+                return (base_word, word_lower[-3:]), 'cao-short'
+            # Syllabify the base word and add the ending as the final syllable
+            return (*self.apply_syllabification_rules(base_word), word_lower[-3:]), 'cao'
+
+        # Step 3: Apply syllabification rules to the normalized word
+        return tuple(self.apply_syllabification_rules(word_lower)), 'rules'
+
     def get_case_type(self, word: str) -> str:
         """Determine the case type of a word."""
+        if not word or word[0].islower():
+            # The common all-lowercase path: one character decides, skipping
+            # the full-string isupper()/istitle() Unicode scans
+            return 'lower'
+        if not word[0].isupper():
+            # Uncased leading character (digit, apostrophe) - the full-string
+            # checks still apply: "1A" is upper, "1Ab" is title
+            if word.isupper():
+                return 'upper'
+            return 'title' if word.istitle() else 'lower'
+        second = word[1] if len(word) > 1 else ''
+        if second and second.islower():
+            # Upper then lower can only be titlecase (or mixed case)
+            return 'title' if word.istitle() else 'lower'
         if word.isupper():
             return 'upper'
-        elif word.istitle():
-            return 'title'
-        else:
-            return 'lower'
-    
-    def handle_cao_words(self, word: str) -> List[str]:
-        """Handle words ending in 'cao' or 'ção' (Portuguese 'ção' sound)."""
-        word_lower = word.lower()
-        
-        # Determine the ending and base word
-        if word_lower.endswith('cao'):
-            ending = word[-3:]  # Preserve original case
-            base_word = word[:-3]
-        elif word_lower.endswith('ção'):
-            ending = word[-3:]  # Preserve original case
-            base_word = word[:-3]
-        else:
-            # Fallback - shouldn't happen but just in case
-            return self.apply_syllabification_rules(word.lower())
-        
-        if len(base_word) <= 2:
-            # Very short base word
-            return [base_word, ending]
-        
-        # Syllabify the base word
-        base_syllables = self.apply_syllabification_rules(base_word.lower())
-        
-        # Add the ending as the final syllable
-        result = base_syllables + [ending]
-        
-        return result
+        return 'title' if word.istitle() else 'lower'
     
     def apply_syllabification_rules(self, word: str) -> List[str]:
-        """Apply syllabification rules to normalized word."""
+        """Apply syllabification rules to a normalized (lowercase) word."""
         if len(word) <= 2:
             return [word]
         
-        # Step 1: Pre-process "gu" and "qu" digraphs
-        word = self.preprocess_gq_digraphs(word)
+        # Step 1: Locate inseparable "gu" and "qu" digraphs without rewriting
+        # the word; distribute_consonants consults the index set instead
+        gq_starts = _inseparable_gq(word)
         
         # Step 2: Mark vowel positions
+        mask = word.translate(_VOWEL_MASK).encode('latin-1', 'replace')
         vowel_positions = []
-        for i, char in enumerate(word):
-            if self.is_vowel(char):
-                vowel_positions.append(i)
+        pos = mask.find(1)
+        while pos != -1:
+            vowel_positions.append(pos)
+            pos = mask.find(1, pos + 1)
         
         if len(vowel_positions) <= 1:
             return [word]
@@ -286,7 +300,8 @@ class PortugueseSyllabifierNLTK:
             
             # Check for diphthongs
             if next_vowel == current_vowel + 1:
-                vowel_pair = word[current_vowel:next_vowel + 1].lower()
+                # The word is already lowercase; no per-pair lower() copy
+                vowel_pair = word[current_vowel:next_vowel + 1]
                 if vowel_pair in self.diphthongs:
                     continue  # No syllabification point for diphthongs
             
@@ -301,56 +316,48 @@ class PortugueseSyllabifierNLTK:
                 syllabification_points.append(current_vowel + 1)
             else:
                 # Multiple consonants - distribute according to rules
-                points = self.distribute_consonants(consonants_between, current_vowel + 1)
+                points = self.distribute_consonants(consonants_between, current_vowel + 1, gq_starts)
                 syllabification_points.extend(points)
         
         # Step 4: Handle final consonants
         syllabification_points = self.handle_final_consonants(word, syllabification_points, vowel_positions)
         
         # Step 5: Build syllables
-        syllables = self.build_syllables_from_points(word, syllabification_points)
-        
-        # Step 6: Post-process to restore original "gu" and "qu"
-        syllables = self.postprocess_gq_digraphs(syllables)
-        
-        return syllables
+        return self.build_syllables_from_points(word, syllabification_points)
     
-    def distribute_consonants(self, consonants: str, start_pos: int) -> List[int]:
+    def distribute_consonants(self, consonants: str, start_pos: int,
+                              gq_starts: frozenset = frozenset()) -> List[int]:
         """Distribute consonants according to Portuguese phonological rules."""
         points = []
         
+        # A trailing g/q that opens an inseparable gu/qu digraph stays glued
+        # to the following vowel; preceding consonants split off in pairs
+        if start_pos + len(consonants) - 1 in gq_starts:
+            for i in range(1, len(consonants) + 1, 2):
+                points.append(start_pos + i)
+            return points
+        
         if len(consonants) == 2:
-            # Two consonants
-            cluster = consonants.lower()
-            
-            # Check for marked digraphs (g̃u, q̃u)
-            if '̃' in consonants:
-                # Marked digraph - inseparable
-                points.append(start_pos)
-            elif cluster in self.separable_digraphs:
-                # Separable digraph - separate them
-                points.append(start_pos + 1)
-            elif cluster in self.imperfect_clusters:
-                # Imperfect cluster - inseparable
-                points.append(start_pos)
-            elif cluster in self.digraphs:
-                # Inseparable digraph - inseparable
-                points.append(start_pos)
-            elif cluster in self.perfect_clusters:
-                # Perfect cluster - separable
-                points.append(start_pos + 1)
+            # Two consonants: one table load replaces the cascade of set
+            # probes. Inseparable pairs (imperfect clusters, digraphs) split
+            # before the cluster; everything else (separable digraphs,
+            # perfect clusters, unknown pairs) splits between the two.
+            first = ord(consonants[0])
+            second = ord(consonants[1])
+            if first < 256 and second < 256:
+                points.append(start_pos + _CLUSTER_DELTA[(first << 8) | second])
             else:
-                # Default: separate
+                # Non-latin-1 characters never form a known cluster
                 points.append(start_pos + 1)
         
         elif len(consonants) == 3:
-            # Three consonants
-            if consonants.lower() in self.complex_clusters:
+            # Three consonants (already lowercase)
+            if consonants in self.complex_clusters:
                 # Special handling for clusters that contain inseparable digraphs
-                if consonants.lower() == 'str':
+                if consonants == 'str':
                     # 'str' should be 's' + 'tr' (where 'tr' is inseparable)
                     points.append(start_pos + 1)
-                elif consonants.lower() == 'scr':
+                elif consonants == 'scr':
                     # 'scr' should be 's' + 'cr' (where 'cr' is inseparable)
                     points.append(start_pos + 1)
                 else:
@@ -376,78 +383,111 @@ class PortugueseSyllabifierNLTK:
         # If word ends with consonants
         if last_vowel < len(word) - 1:
             final_consonants = word[last_vowel + 1:]
+            final_point = None
             
             if len(final_consonants) == 1:
                 # Single final consonant - attach to previous syllable
                 pass  # No additional point needed
             elif len(final_consonants) == 2:
                 # Two final consonants - check if they form a cluster
-                cluster = final_consonants.lower()
+                cluster = final_consonants
                 if cluster in self.imperfect_clusters or cluster in self.digraphs:
                     # Inseparable cluster - attach to previous syllable
                     pass
                 else:
                     # Separable - add point before last consonant
-                    points.append(len(word) - 1)
+                    final_point = len(word) - 1
             else:
                 # More than two final consonants - separate
-                points.append(len(word) - 1)
+                final_point = len(word) - 1
+            
+            # points is already strictly increasing by construction, so the
+            # tail point appends (or bisects in) without a set/sort pass
+            if final_point is not None:
+                if not points or final_point > points[-1]:
+                    points.append(final_point)
+                elif final_point not in points:
+                    insort(points, final_point)
         
-        return sorted(list(set(points)))
+        return points
     
     def build_syllables_from_points(self, word: str, points: List[int]) -> List[str]:
         """Build syllables from syllabification points."""
         if not points:
             return [word]
         
-        syllables = []
-        start = 0
-        
-        for point in sorted(points):
-            if point > start and point < len(word):
-                syllables.append(word[start:point])
-                start = point
-        
-        # Add the last syllable
-        if start < len(word):
-            syllables.append(word[start:])
-        
-        return [syl for syl in syllables if syl]
+        # points is ordered, so pairwise slicing builds the list in a single
+        # comprehension pass; the a < b guard drops empty and duplicate cuts.
+        # Slices are interned: short syllables repeat across the corpus.
+        bounds = [0, *points, len(word)]
+        return [intern(word[a:b]) for a, b in zip(bounds, bounds[1:]) if a < b]
     
-    def restore_case(self, original_word: str, syllables: List[str]) -> List[str]:
-        """Restore original case to syllables."""
-        if not syllables:
-            return syllables
-        
-        case_type = self.get_case_type(original_word)
-        
-        if case_type == 'upper':
-            # All caps - return as is (already processed in lowercase)
-            return syllables
-        elif case_type == 'title':
+    def restore_case(self, original_word: str, syllables: Sequence[str]) -> List[str]:
+        """Restore original case to syllables.
+
+        Accepts the shared syllable tuples from the cache and never mutates
+        its input; a fresh list is built only at this API boundary.
+        """
+        if syllables and self.get_case_type(original_word) == 'title':
             # Title case - capitalize first syllable
-            if syllables:
-                syllables[0] = syllables[0].capitalize()
+            return [syllables[0].capitalize(), *syllables[1:]]
         
-        return syllables
+        # All caps or lowercase - return as is (already processed in lowercase)
+        return list(syllables)
     
     def syllabify_text(self, text: str) -> List[Tuple[str, List[str]]]:
         """
         Separate all words in a text into syllables.
         Returns list of (word, syllables) tuples.
         """
-        # Tokenize the text using NLTK
-        tokens = nltk.word_tokenize(text)
-        
-        results = []
-        for token in tokens:
-            if token.isalpha() or '-' in token or "'" in token:
-                syllables = self.syllabify(token)
-                results.append((token, syllables))
-            else:
-                results.append((token, [token]))
-        
-        return results
+        # Tokenize the text
+        tokens = _TOKEN_PAT.findall(text)
+        
+        word_like = [token.isalpha() or '-' in token or "'" in token
+                     for token in tokens]
+        syllabified = iter(self.syllabify_many(
+            [token for token, is_word in zip(tokens, word_like) if is_word]))
+        return [(token, next(syllabified) if is_word else [token])
+                for token, is_word in zip(tokens, word_like)]
+
+    def syllabify_many(self, words: List[str]) -> List[List[str]]:
+        """Separate a batch of words into syllables in one call.
+
+        The per-word method lookup is hoisted out of the loop, and with the
+        memoized rule engine every repeated word in the batch costs a single
+        cache hit.
+        """
+        syllabify = self.syllabify
+        return [syllabify(word) for word in words]
+
+def _build_cluster_delta() -> bytes:
+    """Build the two-consonant classification table.
+
+    Indexed by (ord(c1) << 8) | ord(c2); the stored value is the offset of
+    the syllable boundary relative to the cluster start (0 = split before an
+    inseparable pair, 1 = split between the consonants).
+    """
+    delta = bytearray(b'\x01' * 65536)
+    inseparable = (PortugueseSyllabifierNLTK.imperfect_clusters
+                   | PortugueseSyllabifierNLTK.digraphs)
+    for cluster in inseparable:
+        # Cover every case combination, matching the old lower()ed lookup
+        for first in (cluster[0], cluster[0].upper()):
+            for second in (cluster[1], cluster[1].upper()):
+                delta[(ord(first) << 8) | ord(second)] = 0
+    return bytes(delta)
+
+_CLUSTER_DELTA = _build_cluster_delta()
+
+@lru_cache(maxsize=1)
+def get_shared_syllabifier() -> PortugueseSyllabifierNLTK:
+    """Return a process-wide shared syllabifier instance.
+
+    Construction is relatively heavy (NLTK data check plus rule tables), so
+    every consumer should go through this factory instead of instantiating
+    its own copy.
+    """
+    return PortugueseSyllabifierNLTK()
 
 # Test function
 def test_new_syllabifier():